@@ -1,6 +1,9 @@
 use std::fmt;
+use std::rc::Rc;
 
-#[derive(Debug, Clone, PartialEq)]
+pub const COMPTEUR_SLOT: usize = 0;
+
+#[derive(Debug, Clone, Copy, PartialEq)]
 pub struct Position {
     pub line: usize,
     pub column: usize,
@@ -18,7 +21,13 @@ impl fmt::Display for Position {
     }
 }
 
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone)]
+pub struct ElifClause {
+    pub condition: ASTNode,
+    pub body: Box<[ASTNode]>,
+}
+
+#[derive(Debug, Clone)]
 pub enum ASTNode {
     Program {
         statements: Vec<ASTNode>,
@@ -31,25 +40,27 @@ pub enum ASTNode {
     },
     
     Identifier {
-        name: String,
+        name: Rc<str>,
+        slot: usize,
         position: Position,
     },
     
     BinaryOp {
         left: Box<ASTNode>,
-        operator: String,
+        operator: &'static str,
         right: Box<ASTNode>,
         position: Position,
     },
     
     UnaryOp {
-        operator: String,
+        operator: &'static str,
         operand: Box<ASTNode>,
         position: Position,
     },
     
     Assignment {
-        name: String,
+        name: Rc<str>,
+        slot: usize,
         value: Box<ASTNode>,
         position: Position,
     },
@@ -62,35 +73,36 @@ pub enum ASTNode {
     
     IfStatement {
         condition: Box<ASTNode>,
-        then_block: Vec<ASTNode>,
-        elif_blocks: Vec<(ASTNode, Vec<ASTNode>)>,
-        else_block: Option<Vec<ASTNode>>,
+        then_block: Box<[ASTNode]>,
+        elif_blocks: Box<[ElifClause]>,
+        else_block: Option<Box<[ASTNode]>>,
         position: Position,
     },
     
     WhileLoop {
         condition: Box<ASTNode>,
-        body: Vec<ASTNode>,
+        body: Box<[ASTNode]>,
         position: Position,
     },
     
     RepeatLoop {
         count: Box<ASTNode>,
-        body: Vec<ASTNode>,
+        body: Box<[ASTNode]>,
         position: Position,
     },
     
     ForEachLoop {
-        iterator: String,
+        iterator: Rc<str>,
+        slot: usize,
         iterable: Box<ASTNode>,
-        body: Vec<ASTNode>,
+        body: Box<[ASTNode]>,
         position: Position,
     },
     
     FunctionDef {
         name: String,
-        parameters: Vec<String>,
-        body: Vec<ASTNode>,
+        parameters: Box<[(Rc<str>, usize)]>,
+        body: Box<[ASTNode]>,
         position: Position,
     },
     
@@ -123,8 +135,8 @@ pub enum ASTNode {
     },
     
     TryExcept {
-        try_block: Vec<ASTNode>,
-        except_block: Vec<ASTNode>,
+        try_block: Box<[ASTNode]>,
+        except_block: Box<[ASTNode]>,
         position: Position,
     },
     
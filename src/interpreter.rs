@@ -1,12 +1,13 @@
-use crate::ast::{ASTNode, LiteralValue};
+use crate::ast::{ASTNode, LiteralValue, Position, COMPTEUR_SLOT};
 use crate::error::{ErrorCatalog, MeowLangError};
 use std::collections::HashMap;
+use std::rc::Rc;
 use std::io::{self, Write};
 use rand::Rng;
 use std::thread;
 use std::time::Duration;
 
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone)]
 pub enum Value {
     String(String),
     Number(f64),
@@ -61,20 +62,20 @@ impl Value {
 }
 
 pub struct Interpreter {
-    variables: HashMap<String, Value>,
-    functions: HashMap<String, (Vec<String>, Vec<ASTNode>)>,
+    variables: Vec<Option<Value>>,
+    functions: HashMap<String, Rc<(Box<[(Rc<str>, usize)]>, Box<[ASTNode]>)>>,
     filename: String,
-    source_lines: Vec<String>,
+    source: Rc<str>,
     repeat_counter: Option<i64>,
 }
 
 impl Interpreter {
-    pub fn new(filename: String, source_lines: Vec<String>) -> Self {
+    pub fn new(filename: String, source: Rc<str>) -> Self {
         Interpreter {
-            variables: HashMap::new(),
+            variables: Vec::new(),
             functions: HashMap::new(),
             filename,
-            source_lines,
+            source,
             repeat_counter: None,
         }
     }
@@ -99,22 +100,22 @@ impl Interpreter {
                 }
             },
             
-            ASTNode::Identifier { name, position } => {
-                if name == "compteur" {
+            ASTNode::Identifier { name, slot, position } => {
+                if *slot == COMPTEUR_SLOT {
                     if let Some(counter) = self.repeat_counter {
                         return Ok(Value::Integer(counter));
                     }
                 }
                 
-                self.variables.get(name).cloned().ok_or_else(|| {
+                self.variables.get(*slot).cloned().flatten().ok_or_else(|| {
                     MeowLangError::new(
                         ErrorCatalog::get("E200"),
                         self.filename.clone(),
                         position.line,
                         position.column,
                     )
-                    .with_extra("var_name".to_string(), name.clone())
-                    .with_context(&self.source_lines)
+                    .with_extra("var_name", name.to_string())
+                    .with_context(&self.source)
                 })
             },
             
@@ -122,88 +123,32 @@ impl Interpreter {
                 let left_val = self.execute(left)?;
                 let right_val = self.execute(right)?;
                 
-                match operator.as_str() {
+                match *operator {
                     "+" => {
                         match (&left_val, &right_val) {
                             (Value::String(l), Value::String(r)) => Ok(Value::String(format!("{}{}", l, r))),
                             (Value::String(l), r) => Ok(Value::String(format!("{}{}", l, r.to_string()))),
                             (l, Value::String(r)) => Ok(Value::String(format!("{}{}", l.to_string(), r))),
                             _ => {
-                                let l = left_val.to_number().map_err(|_| {
-                                    MeowLangError::new(
-                                        ErrorCatalog::get("E202"),
-                                        self.filename.clone(),
-                                        position.line,
-                                        position.column,
-                                    ).with_context(&self.source_lines)
-                                })?;
-                                let r = right_val.to_number().map_err(|_| {
-                                    MeowLangError::new(
-                                        ErrorCatalog::get("E202"),
-                                        self.filename.clone(),
-                                        position.line,
-                                        position.column,
-                                    ).with_context(&self.source_lines)
-                                })?;
+                                let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                                let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                                 Ok(Value::Number(l + r))
                             }
                         }
                     },
                     "-" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Number(l - r))
                     },
                     "*" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Number(l * r))
                     },
                     "/" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         
                         if r == 0.0 {
                             return Err(MeowLangError::new(
@@ -211,125 +156,41 @@ impl Interpreter {
                                 self.filename.clone(),
                                 position.line,
                                 position.column,
-                            ).with_context(&self.source_lines));
+                            ).with_context(&self.source));
                         }
                         
                         Ok(Value::Number(l / r))
                     },
                     "%" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Number(l % r))
                     },
                     "**" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Number(l.powf(r)))
                     },
                     "=" => Ok(Value::Boolean(self.values_equal(&left_val, &right_val))),
                     "!=" => Ok(Value::Boolean(!self.values_equal(&left_val, &right_val))),
                     "<" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Boolean(l < r))
                     },
                     ">" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Boolean(l > r))
                     },
                     "<=" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Boolean(l <= r))
                     },
                     ">=" => {
-                        let l = left_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
-                        let r = right_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let l = left_val.to_number().map_err(|_| self.type_error(position))?;
+                        let r = right_val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Boolean(l >= r))
                     },
                     "et" => Ok(Value::Boolean(left_val.to_bool() && right_val.to_bool())),
@@ -339,23 +200,16 @@ impl Interpreter {
                         self.filename.clone(),
                         position.line,
                         position.column,
-                    ).with_context(&self.source_lines)),
+                    ).with_context(&self.source)),
                 }
             },
             
             ASTNode::UnaryOp { operator, operand, position } => {
                 let val = self.execute(operand)?;
                 
-                match operator.as_str() {
+                match *operator {
                     "-" => {
-                        let n = val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })?;
+                        let n = val.to_number().map_err(|_| self.type_error(position))?;
                         Ok(Value::Number(-n))
                     },
                     "non" => Ok(Value::Boolean(!val.to_bool())),
@@ -364,13 +218,13 @@ impl Interpreter {
                         self.filename.clone(),
                         position.line,
                         position.column,
-                    ).with_context(&self.source_lines)),
+                    ).with_context(&self.source)),
                 }
             },
             
-            ASTNode::Assignment { name, value, .. } => {
+            ASTNode::Assignment { slot, value, .. } => {
                 let val = self.execute(value)?;
-                self.variables.insert(name.clone(), val.clone());
+                self.set_variable(*slot, val.clone());
                 Ok(val)
             },
             
@@ -389,11 +243,11 @@ impl Interpreter {
                     return Ok(result);
                 }
                 
-                for (elif_cond, elif_body) in elif_blocks {
-                    let elif_val = self.execute(elif_cond)?;
+                for elif in elif_blocks.iter() {
+                    let elif_val = self.execute(&elif.condition)?;
                     if elif_val.to_bool() {
                         let mut result = Value::None;
-                        for stmt in elif_body {
+                        for stmt in &elif.body {
                             result = self.execute(stmt)?;
                         }
                         return Ok(result);
@@ -402,7 +256,7 @@ impl Interpreter {
                 
                 if let Some(else_body) = else_block {
                     let mut result = Value::None;
-                    for stmt in else_body {
+                    for stmt in else_body.iter() {
                         result = self.execute(stmt)?;
                     }
                     return Ok(result);
@@ -425,14 +279,7 @@ impl Interpreter {
             
             ASTNode::RepeatLoop { count, body, .. } => {
                 let count_val = self.execute(count)?;
-                let n = count_val.to_number().map_err(|_| {
-                    MeowLangError::new(
-                        ErrorCatalog::get("E202"),
-                        self.filename.clone(),
-                        count.position().line,
-                        count.position().column,
-                    ).with_context(&self.source_lines)
-                })? as i64;
+                let n = count_val.to_number().map_err(|_| self.type_error(count.position()))? as i64;
                 
                 let mut result = Value::None;
                 
@@ -447,23 +294,18 @@ impl Interpreter {
                 Ok(result)
             },
             
-            ASTNode::ForEachLoop { iterator, iterable, body, position } => {
+            ASTNode::ForEachLoop { slot, iterable, body, position, .. } => {
                 let iterable_val = self.execute(iterable)?;
                 
                 let items = match iterable_val {
                     Value::List(ref items) => items.clone(),
-                    _ => return Err(MeowLangError::new(
-                        ErrorCatalog::get("E202"),
-                        self.filename.clone(),
-                        position.line,
-                        position.column,
-                    ).with_context(&self.source_lines)),
+                    _ => return Err(self.type_error(position)),
                 };
                 
                 let mut result = Value::None;
                 
                 for item in items {
-                    self.variables.insert(iterator.clone(), item);
+                    self.set_variable(*slot, item);
                     for stmt in body {
                         result = self.execute(stmt)?;
                     }
@@ -473,7 +315,7 @@ impl Interpreter {
             },
             
             ASTNode::FunctionDef { name, parameters, body, .. } => {
-                self.functions.insert(name.clone(), (parameters.clone(), body.clone()));
+                self.functions.insert(name.clone(), Rc::new((parameters.clone(), body.clone())));
                 Ok(Value::None)
             },
             
@@ -499,14 +341,7 @@ impl Interpreter {
                 
                 match obj_val {
                     Value::List(items) => {
-                        let idx = index_val.to_number().map_err(|_| {
-                            MeowLangError::new(
-                                ErrorCatalog::get("E202"),
-                                self.filename.clone(),
-                                position.line,
-                                position.column,
-                            ).with_context(&self.source_lines)
-                        })? as usize;
+                        let idx = index_val.to_number().map_err(|_| self.type_error(position))? as usize;
                         
                         items.get(idx).cloned().ok_or_else(|| {
                             MeowLangError::new(
@@ -515,17 +350,12 @@ impl Interpreter {
                                 position.line,
                                 position.column,
                             )
-                            .with_extra("index".to_string(), idx.to_string())
-                            .with_extra("size".to_string(), items.len().to_string())
-                            .with_context(&self.source_lines)
+                            .with_extra("index", idx.to_string())
+                            .with_extra("size", items.len().to_string())
+                            .with_context(&self.source)
                         })
                     },
-                    _ => Err(MeowLangError::new(
-                        ErrorCatalog::get("E202"),
-                        self.filename.clone(),
-                        position.line,
-                        position.column,
-                    ).with_context(&self.source_lines)),
+                    _ => Err(self.type_error(position)),
                 }
             },
             
@@ -555,6 +385,23 @@ impl Interpreter {
         }
     }
     
+    #[cold]
+    fn type_error(&self, position: &Position) -> MeowLangError {
+        MeowLangError::new(
+            ErrorCatalog::get("E202"),
+            self.filename.clone(),
+            position.line,
+            position.column,
+        ).with_context(&self.source)
+    }
+    
+    fn set_variable(&mut self, slot: usize, value: Value) {
+        if slot >= self.variables.len() {
+            self.variables.resize(slot + 1, None);
+        }
+        self.variables[slot] = Some(value);
+    }
+    
     fn values_equal(&self, left: &Value, right: &Value) -> bool {
         match (left, right) {
             (Value::String(l), Value::String(r)) => l == r,
@@ -566,7 +413,7 @@ impl Interpreter {
         }
     }
     
-    fn execute_function_call(&mut self, name: &str, arguments: &[ASTNode], position: &crate::ast::Position) -> Result<Value, MeowLangError> {
+    fn execute_function_call(&mut self, name: &str, arguments: &[ASTNode], position: &Position) -> Result<Value, MeowLangError> {
         match name {
             "ecrire" => {
                 let mut output = String::new();
@@ -717,8 +564,8 @@ impl Interpreter {
                             position.line,
                             position.column,
                         )
-                        .with_extra("duration".to_string(), seconds.to_string())
-                        .with_context(&self.source_lines));
+                        .with_extra("duration", seconds.to_string())
+                        .with_context(&self.source));
                     }
                     
                     thread::sleep(Duration::from_secs_f64(seconds));
@@ -729,7 +576,9 @@ impl Interpreter {
             },
             
             _ => {
-                if let Some((params, body)) = self.functions.get(name).cloned() {
+                if let Some(function) = self.functions.get(name).cloned() {
+                    let (params, body) = &*function;
+                    
                     if params.len() != arguments.len() {
                         return Err(MeowLangError::new(
                             ErrorCatalog::get("E601"),
@@ -737,20 +586,20 @@ impl Interpreter {
                             position.line,
                             position.column,
                         )
-                        .with_extra("expected".to_string(), params.len().to_string())
-                        .with_extra("received".to_string(), arguments.len().to_string())
-                        .with_context(&self.source_lines));
+                        .with_extra("expected", params.len().to_string())
+                        .with_extra("received", arguments.len().to_string())
+                        .with_context(&self.source));
                     }
                     
                     let old_vars = self.variables.clone();
                     
-                    for (param, arg) in params.iter().zip(arguments.iter()) {
+                    for ((_, slot), arg) in params.iter().zip(arguments.iter()) {
                         let val = self.execute(arg)?;
-                        self.variables.insert(param.clone(), val);
+                        self.set_variable(*slot, val);
                     }
                     
                     let mut result = Value::None;
-                    for stmt in &body {
+                    for stmt in body {
                         result = self.execute(stmt)?;
                     }
                     
@@ -763,8 +612,8 @@ impl Interpreter {
                         position.line,
                         position.column,
                     )
-                    .with_extra("func_name".to_string(), name.to_string())
-                    .with_context(&self.source_lines))
+                    .with_extra("func_name", name.to_string())
+                    .with_context(&self.source))
                 }
             }
         }
@@ -1,33 +1,31 @@
 use crate::token::{Token, TokenType, TokenValue};
 use crate::error::{ErrorCatalog, MeowLangError};
+use std::rc::Rc;
 
 pub struct Lexer {
     chars: Vec<char>,
     filename: String,
-    lines: Vec<String>,
+    source: Rc<str>,
     pos: usize,
     line: usize,
     column: usize,
     tokens: Vec<Token>,
     indent_stack: Vec<usize>,
-    at_line_start: bool,
 }
 
 impl Lexer {
-    pub fn new(source: String, filename: String) -> Self {
-        let lines: Vec<String> = source.lines().map(|s| s.to_string()).collect();
+    pub fn new(source: Rc<str>, filename: String) -> Self {
         let chars: Vec<char> = source.chars().collect();
         
         Lexer {
             chars,
             filename,
-            lines,
+            source,
             pos: 0,
             line: 1,
             column: 1,
             tokens: Vec::new(),
             indent_stack: vec![0],
-            at_line_start: true,
         }
     }
     
@@ -52,7 +50,6 @@ impl Lexer {
             if ch == '\n' {
                 self.line += 1;
                 self.column = 1;
-                self.at_line_start = true;
             } else {
                 self.column += 1;
             }
@@ -60,23 +57,38 @@ impl Lexer {
         }
     }
     
-    fn skip_whitespace(&mut self, skip_newlines: bool) {
-        while let Some(ch) = self.current_char() {
-            if ch == ' ' || ch == '\t' || ch == '\r' {
-                self.advance();
-            } else if skip_newlines && ch == '\n' {
-                self.advance();
+    fn advance_by(&mut self, count: usize) {
+        self.pos += count;
+        self.column += count;
+    }
+    
+    fn advance_to(&mut self, end: usize) {
+        for &ch in &self.chars[self.pos..end] {
+            if ch == '\n' {
+                self.line += 1;
+                self.column = 1;
             } else {
-                break;
+                self.column += 1;
             }
         }
+        self.pos = end;
+    }
+    
+    fn skip_whitespace(&mut self) {
+        let length = self.chars[self.pos..]
+            .iter()
+            .take_while(|ch| matches!(ch, ' ' | '\t' | '\r'))
+            .count();
+        self.advance_by(length);
     }
     
     fn skip_comment(&mut self) {
         if self.current_char() == Some('#') {
-            while self.current_char().is_some() && self.current_char() != Some('\n') {
-                self.advance();
-            }
+            let length = self.chars[self.pos..]
+                .iter()
+                .position(|ch| *ch == '\n')
+                .unwrap_or(self.chars.len() - self.pos);
+            self.advance_by(length);
         }
     }
     
@@ -86,27 +98,35 @@ impl Lexer {
         let quote_char = self.current_char().unwrap();
         self.advance();
         
+        let start = self.pos;
+        let end = self.chars[start..]
+            .iter()
+            .position(|ch| *ch == quote_char || *ch == '\\')
+            .map(|offset| start + offset);
+        
+        if let Some(end) = end {
+            if self.chars[end] == quote_char {
+                let result: String = self.chars[start..end].iter().collect();
+                self.advance_to(end + 1);
+                return Ok(result);
+            }
+        }
+        
         let mut result = String::new();
         
-        while self.current_char().is_some() && self.current_char() != Some(quote_char) {
-            if self.current_char() == Some('\\') {
-                self.advance();
-                if let Some(ch) = self.current_char() {
-                    let escaped = match ch {
-                        'n' => '\n',
-                        't' => '\t',
-                        'r' => '\r',
-                        '\\' => '\\',
-                        '"' => '"',
-                        '\'' => '\'',
-                        _ => ch,
-                    };
-                    result.push(escaped);
+        while let Some(ch) = self.current_char() {
+            if ch == quote_char {
+                break;
+            }
+            
+            self.advance();
+            if ch == '\\' {
+                if let Some(escaped) = self.current_char() {
+                    result.push(unescape(escaped));
                     self.advance();
                 }
             } else {
-                result.push(self.current_char().unwrap());
-                self.advance();
+                result.push(ch);
             }
         }
         
@@ -116,7 +136,7 @@ impl Lexer {
                 self.filename.clone(),
                 start_line,
                 start_column,
-            ).with_context(&self.lines));
+            ).with_context(&self.source));
         }
         
         self.advance();
@@ -125,50 +145,49 @@ impl Lexer {
     
     fn read_number(&mut self) -> (f64, bool) {
         let start = self.pos;
+        let mut end = start;
         let mut has_dot = false;
         
-        while let Some(ch) = self.current_char() {
+        while end < self.chars.len() {
+            let ch = self.chars[end];
             if ch.is_ascii_digit() {
-                self.advance();
-            } else if ch == '.' && !has_dot {
-                if let Some(next) = self.peek_char(1) {
-                    if next.is_ascii_digit() {
-                        has_dot = true;
-                        self.advance();
-                    } else {
-                        break;
-                    }
-                } else {
-                    break;
-                }
+                end += 1;
+            } else if ch == '.' && !has_dot && self.chars.get(end + 1).map_or(false, |next| next.is_ascii_digit()) {
+                has_dot = true;
+                end += 1;
             } else {
                 break;
             }
         }
         
-        let number_str: String = self.chars[start..self.pos].iter().collect();
+        self.advance_by(end - start);
+        let number_str: String = self.chars[start..end].iter().collect();
         let number = number_str.parse::<f64>().unwrap_or(0.0);
         (number, has_dot)
     }
     
     fn read_identifier(&mut self) -> String {
         let start = self.pos;
+        let length = self.chars[start..]
+            .iter()
+            .take_while(|ch| is_identifier_char(**ch))
+            .count();
         
-        while let Some(ch) = self.current_char() {
-            if ch.is_alphanumeric() || ch == '_' {
-                self.advance();
-            } else {
-                break;
-            }
-        }
-        
+        self.advance_by(length);
         self.chars[start..self.pos].iter().collect()
     }
     
-    fn get_keyword_token(&mut self, identifier: &str, line: usize, column: usize) -> Token {
-        let lower = identifier.to_lowercase();
+    fn get_keyword_token(&mut self, identifier: String, line: usize, column: usize) -> Token {
+        if identifier.len() > LONGEST_KEYWORD || !identifier.is_ascii() {
+            return Token::new(TokenType::Identifier, TokenValue::String(identifier), line, column);
+        }
+        
+        let mut buffer = [0u8; LONGEST_KEYWORD];
+        let lower = &mut buffer[..identifier.len()];
+        lower.copy_from_slice(identifier.as_bytes());
+        lower.make_ascii_lowercase();
         
-        match lower.as_str() {
+        match std::str::from_utf8(lower).unwrap_or_default() {
             "miaou" => Token::simple(TokenType::Miaou, line, column),
             "meow" => Token::simple(TokenType::Meow, line, column),
             "ecrire" => Token::simple(TokenType::Ecrire, line, column),
@@ -176,45 +195,30 @@ impl Lexer {
             "si" => Token::simple(TokenType::Si, line, column),
             "alors" => Token::simple(TokenType::Alors, line, column),
             "sinon" => {
-                self.skip_whitespace(false);
-                if let Some(ch) = self.current_char() {
-                    if ch == 's' {
-                        let next_word = self.peek_identifier();
-                        if next_word.to_lowercase() == "si" {
-                            self.read_identifier();
-                            return Token::simple(TokenType::SinonSi, line, column);
-                        }
-                    }
+                self.skip_whitespace();
+                if self.current_char() == Some('s') && self.next_word_is("si") {
+                    self.advance_by(2);
+                    return Token::simple(TokenType::SinonSi, line, column);
                 }
                 Token::simple(TokenType::Sinon, line, column)
             },
             "repeter" => Token::simple(TokenType::Repeter, line, column),
             "fois" => Token::simple(TokenType::Fois, line, column),
             "tant" => {
-                self.skip_whitespace(false);
-                if let Some(ch) = self.current_char() {
-                    if ch == 'q' {
-                        let next_word = self.peek_identifier();
-                        if next_word.to_lowercase() == "que" {
-                            self.read_identifier();
-                            return Token::simple(TokenType::TantQue, line, column);
-                        }
-                    }
+                self.skip_whitespace();
+                if self.current_char() == Some('q') && self.next_word_is("que") {
+                    self.advance_by(3);
+                    return Token::simple(TokenType::TantQue, line, column);
                 }
-                Token::new(TokenType::Identifier, TokenValue::String(identifier.to_string()), line, column)
+                Token::new(TokenType::Identifier, TokenValue::String(identifier), line, column)
             },
             "pour" => {
-                self.skip_whitespace(false);
-                if let Some(ch) = self.current_char() {
-                    if ch == 'c' {
-                        let next_word = self.peek_identifier();
-                        if next_word.to_lowercase() == "chaque" {
-                            self.read_identifier();
-                            return Token::simple(TokenType::PourChaque, line, column);
-                        }
-                    }
+                self.skip_whitespace();
+                if self.current_char() == Some('c') && self.next_word_is("chaque") {
+                    self.advance_by(6);
+                    return Token::simple(TokenType::PourChaque, line, column);
                 }
-                Token::new(TokenType::Identifier, TokenValue::String(identifier.to_string()), line, column)
+                Token::new(TokenType::Identifier, TokenValue::String(identifier), line, column)
             },
             "dans" => Token::simple(TokenType::Dans, line, column),
             "compteur" => Token::simple(TokenType::Compteur, line, column),
@@ -247,25 +251,21 @@ impl Lexer {
             "ou" => Token::simple(TokenType::Ou, line, column),
             "non" => Token::simple(TokenType::Non, line, column),
             "a" => Token::simple(TokenType::A, line, column),
-            _ => Token::new(TokenType::Identifier, TokenValue::String(identifier.to_string()), line, column),
+            _ => Token::new(TokenType::Identifier, TokenValue::String(identifier), line, column),
         }
     }
     
-    fn peek_identifier(&self) -> String {
+    fn next_word_is(&self, word: &str) -> bool {
         let mut pos = self.pos;
-        let mut result = String::new();
         
-        while pos < self.chars.len() {
-            let ch = self.chars[pos];
-            if ch.is_alphanumeric() || ch == '_' {
-                result.push(ch);
-                pos += 1;
-            } else {
-                break;
+        for expected in word.chars() {
+            match self.chars.get(pos) {
+                Some(ch) if ch.to_lowercase().eq(std::iter::once(expected)) => pos += 1,
+                _ => return false,
             }
         }
         
-        result
+        !self.chars.get(pos).map_or(false, |ch| is_identifier_char(*ch))
     }
     
     fn handle_indentation(&mut self, indent_level: usize) {
@@ -280,214 +280,97 @@ impl Lexer {
                 1,
             ));
         } else if indent_level < current_indent {
-            while !self.indent_stack.is_empty() && *self.indent_stack.last().unwrap() > indent_level {
-                self.indent_stack.pop();
-                self.tokens.push(Token::new(
-                    TokenType::Dedent,
-                    TokenValue::Indent(indent_level),
-                    self.line,
-                    1,
-                ));
+            let keep = self.indent_stack.partition_point(|&level| level <= indent_level);
+            let dedents = self.indent_stack.len() - keep;
+            self.indent_stack.truncate(keep);
+            
+            let dedent = Token::new(TokenType::Dedent, TokenValue::Indent(indent_level), self.line, 1);
+            self.tokens.extend(std::iter::repeat(dedent).take(dedents));
+        }
+    }
+    
+    fn handle_line_start(&mut self) {
+        loop {
+            let (length, indent_level) = self.chars[self.pos..]
+                .iter()
+                .map_while(|ch| match ch {
+                    ' ' => Some(1),
+                    '\t' => Some(4),
+                    _ => None,
+                })
+                .fold((0, 0), |(length, indent), width| (length + 1, indent + width));
+            self.advance_by(length);
+            
+            match self.current_char() {
+                Some('#') => self.skip_comment(),
+                Some('\n') => self.advance(),
+                Some(_) => {
+                    self.handle_indentation(indent_level);
+                    return;
+                },
+                None => return,
             }
         }
     }
     
     pub fn tokenize(&mut self) -> Result<Vec<Token>, MeowLangError> {
+        self.handle_line_start();
+        
         while self.pos < self.chars.len() {
-            if self.at_line_start {
-                let mut indent_level = 0;
-                
-                while let Some(ch) = self.current_char() {
-                    if ch == ' ' {
-                        indent_level += 1;
-                        self.advance();
-                    } else if ch == '\t' {
-                        indent_level += 4;
-                        self.advance();
-                    } else {
-                        break;
-                    }
-                }
-                
-                if self.current_char() == Some('#') {
-                    self.skip_comment();
-                    continue;
-                }
-                
-                if self.current_char() == Some('\n') {
-                    self.advance();
-                    continue;
-                }
-                
-                if self.current_char().is_none() {
-                    break;
-                }
-                
-                self.handle_indentation(indent_level);
-                self.at_line_start = false;
-                continue;
-            }
-            
-            let ch = match self.current_char() {
-                Some(c) => c,
-                None => break,
-            };
-            
-            if ch == ' ' || ch == '\t' || ch == '\r' {
-                self.skip_whitespace(false);
-                continue;
-            }
-            
-            if ch == '#' {
-                self.skip_comment();
-                continue;
-            }
-            
-            if ch == '\n' {
-                self.tokens.push(Token::simple(TokenType::Newline, self.line, self.column));
-                self.advance();
-                continue;
-            }
-            
-            if ch == '"' || ch == '\'' {
-                let line = self.line;
-                let column = self.column;
-                let string_val = self.read_string()?;
-                self.tokens.push(Token::new(
-                    TokenType::String,
-                    TokenValue::String(string_val),
-                    line,
-                    column,
-                ));
-                continue;
-            }
-            
-            if ch.is_ascii_digit() {
-                let line = self.line;
-                let column = self.column;
-                let (number, has_dot) = self.read_number();
-                
-                if has_dot {
-                    self.tokens.push(Token::new(TokenType::Number, TokenValue::Number(number), line, column));
-                } else {
-                    self.tokens.push(Token::new(TokenType::Number, TokenValue::Integer(number as i64), line, column));
-                }
-                continue;
-            }
-            
-            if ch.is_alphabetic() || ch == '_' {
-                let line = self.line;
-                let column = self.column;
-                let identifier = self.read_identifier();
-                let token = self.get_keyword_token(&identifier, line, column);
-                self.tokens.push(token);
-                continue;
-            }
-            
+            let ch = self.chars[self.pos];
             let line = self.line;
             let column = self.column;
             
             match ch {
-                '+' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::Plus, line, column));
-                },
-                '-' => {
+                ' ' | '\t' | '\r' => self.skip_whitespace(),
+                '#' => self.skip_comment(),
+                '\n' => {
+                    self.tokens.push(Token::simple(TokenType::Newline, line, column));
                     self.advance();
-                    self.tokens.push(Token::simple(TokenType::Minus, line, column));
-                },
-                '*' => {
-                    self.advance();
-                    if self.current_char() == Some('*') {
-                        self.advance();
-                        self.tokens.push(Token::simple(TokenType::Power, line, column));
-                    } else {
-                        self.tokens.push(Token::simple(TokenType::Multiply, line, column));
-                    }
+                    self.handle_line_start();
                 },
-                '/' => {
-                    self.advance();
-                    if self.current_char() == Some('/') {
-                        self.advance();
-                        self.tokens.push(Token::simple(TokenType::FloorDiv, line, column));
-                    } else {
-                        self.tokens.push(Token::simple(TokenType::Divide, line, column));
-                    }
-                },
-                '%' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::Modulo, line, column));
-                },
-                '=' => {
-                    self.advance();
-                    if self.current_char() == Some('=') {
-                        self.advance();
-                        self.tokens.push(Token::simple(TokenType::Equal, line, column));
-                    } else {
-                        self.tokens.push(Token::simple(TokenType::Assign, line, column));
-                    }
-                },
-                '!' => {
-                    self.advance();
-                    if self.current_char() == Some('=') {
-                        self.advance();
-                        self.tokens.push(Token::simple(TokenType::NotEqual, line, column));
-                    }
-                },
-                '<' => {
-                    self.advance();
-                    if self.current_char() == Some('=') {
-                        self.advance();
-                        self.tokens.push(Token::simple(TokenType::LessEqual, line, column));
-                    } else {
-                        self.tokens.push(Token::simple(TokenType::LessThan, line, column));
+                '"' | '\'' => {
+                    let string_val = self.read_string()?;
+                    self.tokens.push(Token::new(
+                        TokenType::String,
+                        TokenValue::String(string_val),
+                        line,
+                        column,
+                    ));
+                    
+                    if self.line != line {
+                        self.handle_line_start();
                     }
                 },
-                '>' => {
-                    self.advance();
-                    if self.current_char() == Some('=') {
-                        self.advance();
-                        self.tokens.push(Token::simple(TokenType::GreaterEqual, line, column));
+                '0'..='9' => {
+                    let (number, has_dot) = self.read_number();
+                    
+                    if has_dot {
+                        self.tokens.push(Token::new(TokenType::Number, TokenValue::Number(number), line, column));
                     } else {
-                        self.tokens.push(Token::simple(TokenType::GreaterThan, line, column));
+                        self.tokens.push(Token::new(TokenType::Number, TokenValue::Integer(number as i64), line, column));
                     }
                 },
-                ':' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::Colon, line, column));
-                },
-                ',' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::Comma, line, column));
-                },
-                '(' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::LParen, line, column));
+                _ if ch == '_' || ch.is_alphabetic() => {
+                    let identifier = self.read_identifier();
+                    let token = self.get_keyword_token(identifier, line, column);
+                    self.tokens.push(token);
                 },
-                ')' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::RParen, line, column));
-                },
-                '[' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::LBracket, line, column));
-                },
-                ']' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::RBracket, line, column));
-                },
-                '.' => {
-                    self.advance();
-                    self.tokens.push(Token::simple(TokenType::Dot, line, column));
+                _ => match operator_token(ch, self.peek_char(1)) {
+                    Some((token_type, length)) => {
+                        self.tokens.push(Token::simple(token_type, line, column));
+                        self.advance_by(length);
+                    },
+                    None if ch == '!' => self.advance_by(1),
+                    None => {
+                        return Err(MeowLangError::new(
+                            ErrorCatalog::get("E100"),
+                            self.filename.clone(),
+                            line,
+                            column,
+                        ).with_instruction(ch.to_string()).with_context(&self.source));
+                    },
                 },
-                _ => {
-                    return Err(MeowLangError::new(
-                        ErrorCatalog::get("E100"),
-                        self.filename.clone(),
-                        line,
-                        column,
-                    ).with_instruction(ch.to_string()).with_context(&self.lines));
-                }
             }
         }
         
@@ -498,6 +381,63 @@ impl Lexer {
         
         self.tokens.push(Token::simple(TokenType::Eof, self.line, self.column));
         
-        Ok(self.tokens.clone())
+        Ok(std::mem::take(&mut self.tokens))
+    }
+}
+
+fn unescape(ch: char) -> char {
+    match ch {
+        'n' => '\n',
+        't' => '\t',
+        'r' => '\r',
+        _ => ch,
+    }
+}
+
+// "dictionnaire" : aucun mot-clé n'est plus long, ni ne contient de caractère non ASCII.
+const LONGEST_KEYWORD: usize = 12;
+
+const IDENTIFIER_ASCII: [bool; 128] = {
+    let mut table = [false; 128];
+    let mut byte = 0;
+    while byte < 128 {
+        table[byte] = (byte as u8).is_ascii_alphanumeric() || byte as u8 == b'_';
+        byte += 1;
+    }
+    table
+};
+
+#[inline]
+fn is_identifier_char(ch: char) -> bool {
+    match IDENTIFIER_ASCII.get(ch as usize) {
+        Some(&allowed) => allowed,
+        None => ch.is_alphanumeric(),
+    }
+}
+
+fn operator_token(ch: char, next: Option<char>) -> Option<(TokenType, usize)> {
+    match (ch, next) {
+        ('*', Some('*')) => Some((TokenType::Power, 2)),
+        ('/', Some('/')) => Some((TokenType::FloorDiv, 2)),
+        ('=', Some('=')) => Some((TokenType::Equal, 2)),
+        ('!', Some('=')) => Some((TokenType::NotEqual, 2)),
+        ('<', Some('=')) => Some((TokenType::LessEqual, 2)),
+        ('>', Some('=')) => Some((TokenType::GreaterEqual, 2)),
+        ('+', _) => Some((TokenType::Plus, 1)),
+        ('-', _) => Some((TokenType::Minus, 1)),
+        ('*', _) => Some((TokenType::Multiply, 1)),
+        ('/', _) => Some((TokenType::Divide, 1)),
+        ('%', _) => Some((TokenType::Modulo, 1)),
+        ('=', _) => Some((TokenType::Assign, 1)),
+        ('<', _) => Some((TokenType::LessThan, 1)),
+        ('>', _) => Some((TokenType::GreaterThan, 1)),
+        (':', _) => Some((TokenType::Colon, 1)),
+        (',', _) => Some((TokenType::Comma, 1)),
+        ('(', _) => Some((TokenType::LParen, 1)),
+        (')', _) => Some((TokenType::RParen, 1)),
+        ('[', _) => Some((TokenType::LBracket, 1)),
+        (']', _) => Some((TokenType::RBracket, 1)),
+        ('.', _) => Some((TokenType::Dot, 1)),
+        _ => None,
     }
 }
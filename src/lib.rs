@@ -6,6 +6,7 @@ pub mod parser;
 pub mod interpreter;
 
 use std::fs;
+use std::rc::Rc;
 use lexer::Lexer;
 use parser::Parser;
 use interpreter::Interpreter;
@@ -19,22 +20,22 @@ pub fn run_file(filename: &str) -> Result<(), MeowLangError> {
             1,
             1,
         )
-        .with_extra("filename".to_string(), filename.to_string())
+        .with_extra("filename", filename.to_string())
     })?;
     
     run(source, filename.to_string())
 }
 
 pub fn run(source: String, filename: String) -> Result<(), MeowLangError> {
-    let source_lines: Vec<String> = source.lines().map(|s| s.to_string()).collect();
+    let source: Rc<str> = Rc::from(source);
     
-    let mut lexer = Lexer::new(source.clone(), filename.clone());
+    let mut lexer = Lexer::new(Rc::clone(&source), filename.clone());
     let tokens = lexer.tokenize()?;
     
-    let mut parser = Parser::new(tokens, filename.clone(), source_lines.clone());
+    let mut parser = Parser::new(tokens, filename.clone(), Rc::clone(&source));
     let ast = parser.parse()?;
     
-    let mut interpreter = Interpreter::new(filename, source_lines);
+    let mut interpreter = Interpreter::new(filename, source);
     interpreter.execute(&ast)?;
     
     Ok(())
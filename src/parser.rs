@@ -1,24 +1,45 @@
-use crate::ast::{ASTNode, LiteralValue, Position};
+use crate::ast::{ASTNode, ElifClause, LiteralValue, Position, COMPTEUR_SLOT};
 use crate::token::{Token, TokenType, TokenValue};
 use crate::error::{ErrorCatalog, MeowLangError};
+use std::collections::HashMap;
+use std::rc::Rc;
 
 pub struct Parser {
     tokens: Vec<Token>,
     pos: usize,
     filename: String,
-    source_lines: Vec<String>,
+    source: Rc<str>,
+    slots: HashMap<Rc<str>, usize>,
+    compteur: Rc<str>,
 }
 
 impl Parser {
-    pub fn new(tokens: Vec<Token>, filename: String, source_lines: Vec<String>) -> Self {
+    pub fn new(tokens: Vec<Token>, filename: String, source: Rc<str>) -> Self {
+        let compteur: Rc<str> = Rc::from("compteur");
+        let mut slots = HashMap::new();
+        slots.insert(Rc::clone(&compteur), COMPTEUR_SLOT);
+        
         Parser {
             tokens,
             pos: 0,
             filename,
-            source_lines,
+            source,
+            slots,
+            compteur,
+        }
+    }
+    
+    fn slot_for(&mut self, name: &str) -> (Rc<str>, usize) {
+        if let Some((interned, &slot)) = self.slots.get_key_value(name) {
+            return (Rc::clone(interned), slot);
         }
+        let interned: Rc<str> = Rc::from(name);
+        let slot = self.slots.len();
+        self.slots.insert(Rc::clone(&interned), slot);
+        (interned, slot)
     }
     
+    #[inline]
     fn current(&self) -> &Token {
         if self.pos < self.tokens.len() {
             &self.tokens[self.pos]
@@ -27,19 +48,27 @@ impl Parser {
         }
     }
     
+    #[inline]
     fn peek(&self, offset: usize) -> Option<&Token> {
         self.tokens.get(self.pos + offset)
     }
     
+    #[inline]
     fn advance(&mut self) {
         if self.pos < self.tokens.len() {
             self.pos += 1;
         }
     }
     
+    fn take_value(&mut self) -> TokenValue {
+        let index = self.pos.min(self.tokens.len() - 1);
+        std::mem::replace(&mut self.tokens[index].value, TokenValue::None)
+    }
+    
     fn expect(&mut self, token_type: TokenType) -> Result<Token, MeowLangError> {
         if self.current().token_type == token_type {
-            let token = self.current().clone();
+            let value = self.take_value();
+            let token = Token::new(token_type, value, self.current().line, self.current().column);
             self.advance();
             Ok(token)
         } else {
@@ -48,17 +77,20 @@ impl Parser {
                 self.filename.clone(),
                 self.current().line,
                 self.current().column,
-            ).with_context(&self.source_lines))
+            ).with_context(&self.source))
         }
     }
     
     fn skip_newlines(&mut self) {
-        while self.current().token_type == TokenType::Newline {
-            self.advance();
-        }
+        self.pos += self.tokens[self.pos..]
+            .iter()
+            .take_while(|token| token.token_type == TokenType::Newline)
+            .count();
     }
     
-    fn position_from_token(&self, token: &Token) -> Position {
+    #[inline]
+    fn current_position(&self) -> Position {
+        let token = self.current();
         Position::new(token.line, token.column)
     }
     
@@ -71,16 +103,16 @@ impl Parser {
                 self.filename.clone(),
                 1,
                 1,
-            ).with_context(&self.source_lines));
+            ).with_context(&self.source));
         }
         
-        let start_pos = self.position_from_token(self.current());
+        let start_pos = self.current_position();
         self.advance();
         self.skip_newlines();
         
         let mut statements = Vec::new();
         
-        while self.current().token_type != TokenType::Meow && self.current().token_type != TokenType::Eof {
+        while !matches!(self.current().token_type, TokenType::Meow | TokenType::Eof) {
             statements.push(self.parse_statement()?);
             self.skip_newlines();
         }
@@ -91,7 +123,7 @@ impl Parser {
                 self.filename.clone(),
                 self.current().line,
                 self.current().column,
-            ).with_context(&self.source_lines));
+            ).with_context(&self.source));
         }
         
         Ok(ASTNode::Program {
@@ -101,8 +133,6 @@ impl Parser {
     }
     
     fn parse_statement(&mut self) -> Result<ASTNode, MeowLangError> {
-        self.skip_newlines();
-        
         match self.current().token_type {
             TokenType::Ecrire => self.parse_ecrire(),
             TokenType::Si => self.parse_if(),
@@ -112,62 +142,38 @@ impl Parser {
             TokenType::Fonction => self.parse_function_def(),
             TokenType::Retour => self.parse_return(),
             TokenType::Essayer => self.parse_try_except(),
-            TokenType::Identifier => {
-                if self.peek(1).map(|t| &t.token_type) == Some(&TokenType::Assign) {
-                    self.parse_assignment()
-                } else if self.peek(1).map(|t| &t.token_type) == Some(&TokenType::LParen) {
-                    let expr = self.parse_expression()?;
-                    self.skip_newlines();
-                    Ok(ASTNode::ExpressionStatement {
-                        expression: Box::new(expr.clone()),
-                        position: expr.position().clone(),
-                    })
-                } else {
-                    let expr = self.parse_expression()?;
-                    self.skip_newlines();
-                    Ok(ASTNode::ExpressionStatement {
-                        expression: Box::new(expr.clone()),
-                        position: expr.position().clone(),
-                    })
-                }
+            TokenType::Identifier if self.peek(1).map(|t| t.token_type) == Some(TokenType::Assign) => {
+                self.parse_assignment()
             },
             _ => {
                 let expr = self.parse_expression()?;
-                self.skip_newlines();
+                let position = *expr.position();
                 Ok(ASTNode::ExpressionStatement {
-                    expression: Box::new(expr.clone()),
-                    position: expr.position().clone(),
+                    expression: Box::new(expr),
+                    position,
                 })
             }
         }
     }
     
     fn parse_ecrire(&mut self) -> Result<ASTNode, MeowLangError> {
-        let token = self.current().clone();
-        let position = self.position_from_token(&token);
+        let position = self.current_position();
         self.advance();
         
         let mut args = Vec::new();
         
         loop {
             self.skip_newlines();
-            if self.current().token_type == TokenType::Newline || 
-               self.current().token_type == TokenType::Eof {
+            if self.current().token_type == TokenType::Eof {
                 break;
             }
             
             args.push(self.parse_expression()?);
             
-            if self.current().token_type != TokenType::Newline &&
-               self.current().token_type != TokenType::Eof &&
-               self.current().token_type != TokenType::Comma {
-                continue;
-            }
-            
-            if self.current().token_type == TokenType::Comma {
-                self.advance();
-            } else {
-                break;
+            match self.current().token_type {
+                TokenType::Comma => self.advance(),
+                TokenType::Newline | TokenType::Eof => break,
+                _ => {},
             }
         }
         
@@ -179,18 +185,17 @@ impl Parser {
     }
     
     fn parse_assignment(&mut self) -> Result<ASTNode, MeowLangError> {
-        let name_token = self.current().clone();
-        let position = self.position_from_token(&name_token);
+        let position = self.current_position();
         
-        let name = if let TokenValue::String(s) = &name_token.value {
-            s.clone()
+        let (name, slot) = if let TokenValue::String(s) = self.take_value() {
+            self.slot_for(&s)
         } else {
             return Err(MeowLangError::new(
                 ErrorCatalog::get("E104"),
                 self.filename.clone(),
-                name_token.line,
-                name_token.column,
-            ).with_context(&self.source_lines));
+                position.line,
+                position.column,
+            ).with_context(&self.source));
         };
         
         self.advance();
@@ -200,13 +205,14 @@ impl Parser {
         
         Ok(ASTNode::Assignment {
             name,
+            slot,
             value: Box::new(value),
             position,
         })
     }
     
     fn parse_if(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
         let condition = self.parse_expression()?;
@@ -225,13 +231,13 @@ impl Parser {
         
         while self.current().token_type == TokenType::SinonSi {
             self.advance();
-            let elif_condition = self.parse_expression()?;
+            let condition = self.parse_expression()?;
             self.expect(TokenType::Alors)?;
             self.expect(TokenType::Colon)?;
             self.skip_newlines();
             self.expect(TokenType::Indent)?;
-            let elif_body = self.parse_block()?;
-            elif_blocks.push((elif_condition, elif_body));
+            let body = self.parse_block()?;
+            elif_blocks.push(ElifClause { condition, body });
             self.skip_newlines();
         }
         
@@ -246,14 +252,14 @@ impl Parser {
         Ok(ASTNode::IfStatement {
             condition: Box::new(condition),
             then_block,
-            elif_blocks,
+            elif_blocks: elif_blocks.into_boxed_slice(),
             else_block,
             position,
         })
     }
     
     fn parse_while(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
         let condition = self.parse_expression()?;
@@ -272,7 +278,7 @@ impl Parser {
     }
     
     fn parse_repeat(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
         let count = self.parse_expression()?;
@@ -292,19 +298,19 @@ impl Parser {
     }
     
     fn parse_foreach(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
         let iterator_token = self.expect(TokenType::Identifier)?;
-        let iterator = if let TokenValue::String(s) = iterator_token.value {
-            s
+        let (iterator, slot) = if let TokenValue::String(s) = &iterator_token.value {
+            self.slot_for(s)
         } else {
             return Err(MeowLangError::new(
                 ErrorCatalog::get("E104"),
                 self.filename.clone(),
                 iterator_token.line,
                 iterator_token.column,
-            ).with_context(&self.source_lines));
+            ).with_context(&self.source));
         };
         
         self.expect(TokenType::Dans)?;
@@ -319,6 +325,7 @@ impl Parser {
         
         Ok(ASTNode::ForEachLoop {
             iterator,
+            slot,
             iterable: Box::new(iterable),
             body,
             position,
@@ -326,7 +333,7 @@ impl Parser {
     }
     
     fn parse_function_def(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
         let name_token = self.expect(TokenType::Identifier)?;
@@ -338,7 +345,7 @@ impl Parser {
                 self.filename.clone(),
                 name_token.line,
                 name_token.column,
-            ).with_context(&self.source_lines));
+            ).with_context(&self.source));
         };
         
         self.expect(TokenType::LParen)?;
@@ -347,8 +354,8 @@ impl Parser {
         
         while self.current().token_type != TokenType::RParen {
             let param_token = self.expect(TokenType::Identifier)?;
-            if let TokenValue::String(s) = param_token.value {
-                parameters.push(s);
+            if let TokenValue::String(s) = &param_token.value {
+                parameters.push(self.slot_for(s));
             }
             
             if self.current().token_type == TokenType::Comma {
@@ -365,18 +372,17 @@ impl Parser {
         
         Ok(ASTNode::FunctionDef {
             name,
-            parameters,
+            parameters: parameters.into_boxed_slice(),
             body,
             position,
         })
     }
     
     fn parse_return(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
-        if self.current().token_type == TokenType::Newline || 
-           self.current().token_type == TokenType::Eof {
+        if matches!(self.current().token_type, TokenType::Newline | TokenType::Eof) {
             return Ok(ASTNode::ReturnStatement {
                 value: None,
                 position,
@@ -392,7 +398,7 @@ impl Parser {
     }
     
     fn parse_try_except(&mut self) -> Result<ASTNode, MeowLangError> {
-        let position = self.position_from_token(self.current());
+        let position = self.current_position();
         self.advance();
         
         self.expect(TokenType::Colon)?;
@@ -417,13 +423,12 @@ impl Parser {
         })
     }
     
-    fn parse_block(&mut self) -> Result<Vec<ASTNode>, MeowLangError> {
+    fn parse_block(&mut self) -> Result<Box<[ASTNode]>, MeowLangError> {
         let mut statements = Vec::new();
         
         self.skip_newlines();
         
-        while self.current().token_type != TokenType::Dedent && 
-              self.current().token_type != TokenType::Eof {
+        while !matches!(self.current().token_type, TokenType::Dedent | TokenType::Eof) {
             statements.push(self.parse_statement()?);
             self.skip_newlines();
         }
@@ -432,93 +437,56 @@ impl Parser {
             self.advance();
         }
         
-        Ok(statements)
+        Ok(statements.into_boxed_slice())
     }
     
     fn parse_expression(&mut self) -> Result<ASTNode, MeowLangError> {
-        self.parse_or()
-    }
-    
-    fn parse_or(&mut self) -> Result<ASTNode, MeowLangError> {
-        let mut left = self.parse_and()?;
-        
-        while self.current().token_type == TokenType::Ou {
-            let position = self.position_from_token(self.current());
-            self.advance();
-            let right = self.parse_and()?;
-            left = ASTNode::BinaryOp {
-                left: Box::new(left),
-                operator: "ou".to_string(),
-                right: Box::new(right),
-                position,
-            };
+        if self.is_lone_operand() {
+            return self.parse_primary();
         }
         
-        Ok(left)
+        self.parse_binary(OR_PRECEDENCE)
     }
     
-    fn parse_and(&mut self) -> Result<ASTNode, MeowLangError> {
-        let mut left = self.parse_not()?;
-        
-        while self.current().token_type == TokenType::Et {
-            let position = self.position_from_token(self.current());
-            self.advance();
-            let right = self.parse_not()?;
-            left = ASTNode::BinaryOp {
-                left: Box::new(left),
-                operator: "et".to_string(),
-                right: Box::new(right),
-                position,
-            };
-        }
+    fn is_lone_operand(&self) -> bool {
+        let starts_leaf = matches!(
+            self.current().token_type,
+            TokenType::Number | TokenType::String | TokenType::Boolean | TokenType::Identifier | TokenType::Compteur
+        );
         
-        Ok(left)
+        starts_leaf && self.peek(1).map_or(true, |next| {
+            !matches!(next.token_type, TokenType::LParen | TokenType::LBracket)
+                && binary_operator(next.token_type).is_none()
+        })
     }
     
-    fn parse_not(&mut self) -> Result<ASTNode, MeowLangError> {
-        if self.current().token_type == TokenType::Non {
-            let position = self.position_from_token(self.current());
+    fn parse_binary(&mut self, min_precedence: u8) -> Result<ASTNode, MeowLangError> {
+        let mut left = if self.current().token_type == TokenType::Non && min_precedence <= NOT_PRECEDENCE {
+            let position = self.current_position();
             self.advance();
-            let operand = self.parse_not()?;
-            return Ok(ASTNode::UnaryOp {
-                operator: "non".to_string(),
+            let operand = self.parse_binary(NOT_PRECEDENCE)?;
+            ASTNode::UnaryOp {
+                operator: "non",
                 operand: Box::new(operand),
                 position,
-            });
-        }
-        
-        self.parse_comparison()
-    }
-    
-    fn parse_comparison(&mut self) -> Result<ASTNode, MeowLangError> {
-        let mut left = self.parse_additive()?;
+            }
+        } else {
+            let operand = self.parse_unary()?;
+            self.parse_power(operand)?
+        };
         
-        while matches!(
-            self.current().token_type,
-            TokenType::Assign
-                | TokenType::Equal
-                | TokenType::NotEqual
-                | TokenType::LessThan
-                | TokenType::GreaterThan
-                | TokenType::LessEqual
-                | TokenType::GreaterEqual
-        ) {
-            let position = self.position_from_token(self.current());
-            let operator = match self.current().token_type {
-                TokenType::Assign => "=",
-                TokenType::Equal => "=",
-                TokenType::NotEqual => "!=",
-                TokenType::LessThan => "<",
-                TokenType::GreaterThan => ">",
-                TokenType::LessEqual => "<=",
-                TokenType::GreaterEqual => ">=",
-                _ => "",
-            };
+        while let Some((operator, precedence)) = binary_operator(self.current().token_type) {
+            if precedence < min_precedence {
+                break;
+            }
+            
+            let position = self.current_position();
             self.advance();
-            let right = self.parse_additive()?;
+            
+            let right = self.parse_binary(precedence + 1)?;
             left = ASTNode::BinaryOp {
                 left: Box::new(left),
-                operator: operator.to_string(),
+                operator,
                 right: Box::new(right),
                 position,
             };
@@ -527,83 +495,42 @@ impl Parser {
         Ok(left)
     }
     
-    fn parse_additive(&mut self) -> Result<ASTNode, MeowLangError> {
-        let mut left = self.parse_multiplicative()?;
-        
-        while self.current().token_type == TokenType::Plus || 
-              self.current().token_type == TokenType::Minus {
-            let position = self.position_from_token(self.current());
-            let operator = if self.current().token_type == TokenType::Plus {
-                "+"
-            } else {
-                "-"
-            };
-            self.advance();
-            let right = self.parse_multiplicative()?;
-            left = ASTNode::BinaryOp {
-                left: Box::new(left),
-                operator: operator.to_string(),
-                right: Box::new(right),
-                position,
-            };
+    // `**` est associatif à droite : la chaîne est lue en boucle puis repliée
+    // depuis la droite, sans récursion par opérateur.
+    fn parse_power(&mut self, first: ASTNode) -> Result<ASTNode, MeowLangError> {
+        if self.current().token_type != TokenType::Power {
+            return Ok(first);
         }
         
-        Ok(left)
-    }
-    
-    fn parse_multiplicative(&mut self) -> Result<ASTNode, MeowLangError> {
-        let mut left = self.parse_power()?;
+        let mut operands = vec![first];
+        let mut positions = Vec::new();
         
-        while matches!(
-            self.current().token_type,
-            TokenType::Multiply | TokenType::Divide | TokenType::FloorDiv | TokenType::Modulo
-        ) {
-            let position = self.position_from_token(self.current());
-            let operator = match self.current().token_type {
-                TokenType::Multiply => "*",
-                TokenType::Divide => "/",
-                TokenType::FloorDiv => "//",
-                TokenType::Modulo => "%",
-                _ => "",
-            };
+        while self.current().token_type == TokenType::Power {
+            positions.push(self.current_position());
             self.advance();
-            let right = self.parse_power()?;
-            left = ASTNode::BinaryOp {
-                left: Box::new(left),
-                operator: operator.to_string(),
-                right: Box::new(right),
-                position,
-            };
+            operands.push(self.parse_unary()?);
         }
         
-        Ok(left)
-    }
-    
-    fn parse_power(&mut self) -> Result<ASTNode, MeowLangError> {
-        let mut left = self.parse_unary()?;
-        
-        if self.current().token_type == TokenType::Power {
-            let position = self.position_from_token(self.current());
-            self.advance();
-            let right = self.parse_power()?;
-            left = ASTNode::BinaryOp {
+        let mut result = operands.pop().unwrap();
+        while let (Some(left), Some(position)) = (operands.pop(), positions.pop()) {
+            result = ASTNode::BinaryOp {
                 left: Box::new(left),
-                operator: "**".to_string(),
-                right: Box::new(right),
+                operator: "**",
+                right: Box::new(result),
                 position,
             };
         }
         
-        Ok(left)
+        Ok(result)
     }
     
     fn parse_unary(&mut self) -> Result<ASTNode, MeowLangError> {
         if self.current().token_type == TokenType::Minus {
-            let position = self.position_from_token(self.current());
+            let position = self.current_position();
             self.advance();
             let operand = self.parse_unary()?;
             return Ok(ASTNode::UnaryOp {
-                operator: "-".to_string(),
+                operator: "-",
                 operand: Box::new(operand),
                 position,
             });
@@ -619,23 +546,13 @@ impl Parser {
             match self.current().token_type {
                 TokenType::LParen => {
                     if let ASTNode::Identifier { name, .. } = expr {
-                        let position = self.position_from_token(self.current());
+                        let position = self.current_position();
                         self.advance();
                         
-                        let mut arguments = Vec::new();
-                        
-                        while self.current().token_type != TokenType::RParen {
-                            arguments.push(self.parse_expression()?);
-                            
-                            if self.current().token_type == TokenType::Comma {
-                                self.advance();
-                            }
-                        }
-                        
-                        self.expect(TokenType::RParen)?;
+                        let arguments = self.parse_arguments()?;
                         
                         expr = ASTNode::FunctionCall {
-                            name,
+                            name: name.to_string(),
                             arguments,
                             position,
                         };
@@ -644,7 +561,7 @@ impl Parser {
                     }
                 },
                 TokenType::LBracket => {
-                    let position = self.position_from_token(self.current());
+                    let position = self.current_position();
                     self.advance();
                     let index = self.parse_expression()?;
                     self.expect(TokenType::RBracket)?;
@@ -662,30 +579,48 @@ impl Parser {
         Ok(expr)
     }
     
+    fn parse_arguments(&mut self) -> Result<Vec<ASTNode>, MeowLangError> {
+        let mut arguments = Vec::new();
+        
+        while self.current().token_type != TokenType::RParen {
+            arguments.push(self.parse_expression()?);
+            
+            if self.current().token_type == TokenType::Comma {
+                self.advance();
+            }
+        }
+        
+        self.expect(TokenType::RParen)?;
+        
+        Ok(arguments)
+    }
+    
     fn parse_primary(&mut self) -> Result<ASTNode, MeowLangError> {
-        let token = self.current().clone();
-        let position = self.position_from_token(&token);
+        let token_type = self.current().token_type;
+        let position = self.current_position();
         
-        match &token.token_type {
+        match token_type {
             TokenType::Number => {
+                let value = self.take_value();
                 self.advance();
-                match &token.value {
+                match value {
                     TokenValue::Number(n) => Ok(ASTNode::Literal {
-                        value: LiteralValue::Number(*n),
+                        value: LiteralValue::Number(n),
                         position,
                     }),
                     TokenValue::Integer(i) => Ok(ASTNode::Literal {
-                        value: LiteralValue::Integer(*i),
+                        value: LiteralValue::Integer(i),
                         position,
                     }),
                     _ => unreachable!(),
                 }
             },
             TokenType::String => {
+                let value = self.take_value();
                 self.advance();
-                if let TokenValue::String(s) = &token.value {
+                if let TokenValue::String(s) = value {
                     Ok(ASTNode::Literal {
-                        value: LiteralValue::String(s.clone()),
+                        value: LiteralValue::String(s),
                         position,
                     })
                 } else {
@@ -693,10 +628,11 @@ impl Parser {
                 }
             },
             TokenType::Boolean => {
+                let value = self.take_value();
                 self.advance();
-                if let TokenValue::Boolean(b) = &token.value {
+                if let TokenValue::Boolean(b) = value {
                     Ok(ASTNode::Literal {
-                        value: LiteralValue::Boolean(*b),
+                        value: LiteralValue::Boolean(b),
                         position,
                     })
                 } else {
@@ -704,10 +640,13 @@ impl Parser {
                 }
             },
             TokenType::Identifier => {
+                let value = self.take_value();
                 self.advance();
-                if let TokenValue::String(s) = &token.value {
+                if let TokenValue::String(s) = value {
+                    let (name, slot) = self.slot_for(&s);
                     Ok(ASTNode::Identifier {
-                        name: s.clone(),
+                        name,
+                        slot,
                         position,
                     })
                 } else {
@@ -717,7 +656,8 @@ impl Parser {
             TokenType::Compteur => {
                 self.advance();
                 Ok(ASTNode::Identifier {
-                    name: "compteur".to_string(),
+                    name: Rc::clone(&self.compteur),
+                    slot: COMPTEUR_SLOT,
                     position,
                 })
             },
@@ -731,17 +671,7 @@ impl Parser {
                 self.advance();
                 self.expect(TokenType::LParen)?;
                 
-                let mut elements = Vec::new();
-                
-                while self.current().token_type != TokenType::RParen {
-                    elements.push(self.parse_expression()?);
-                    
-                    if self.current().token_type == TokenType::Comma {
-                        self.advance();
-                    }
-                }
-                
-                self.expect(TokenType::RParen)?;
+                let elements = self.parse_arguments()?;
                 
                 Ok(ASTNode::ListNode {
                     elements,
@@ -751,35 +681,28 @@ impl Parser {
             TokenType::Demander => {
                 self.advance();
                 
-                let type_token = self.current().clone();
-                let input_type = if type_token.token_type == TokenType::Identifier {
-                    if let TokenValue::String(s) = &type_token.value {
+                let type_token = self.current();
+                let input_type = match (&type_token.token_type, &type_token.value) {
+                    (TokenType::Identifier, TokenValue::String(s)) => {
                         let lower = s.to_lowercase();
                         if lower == "texte" || lower == "nombre" {
-                            lower
+                            Some(lower)
                         } else {
-                            return Err(MeowLangError::new(
-                                ErrorCatalog::get("E104"),
-                                self.filename.clone(),
-                                type_token.line,
-                                type_token.column,
-                            ).with_context(&self.source_lines));
+                            None
                         }
-                    } else {
+                    },
+                    _ => None,
+                };
+                let input_type = match input_type {
+                    Some(input_type) => input_type,
+                    None => {
                         return Err(MeowLangError::new(
                             ErrorCatalog::get("E104"),
                             self.filename.clone(),
                             type_token.line,
                             type_token.column,
-                        ).with_context(&self.source_lines));
-                    }
-                } else {
-                    return Err(MeowLangError::new(
-                        ErrorCatalog::get("E104"),
-                        self.filename.clone(),
-                        type_token.line,
-                        type_token.column,
-                    ).with_context(&self.source_lines));
+                        ).with_context(&self.source));
+                    },
                 };
                 self.advance();
                 
@@ -794,7 +717,7 @@ impl Parser {
             TokenType::Minuscule | TokenType::Majuscule | TokenType::Longueur | 
             TokenType::Aleatoire | TokenType::Sqrt | TokenType::Abs | 
             TokenType::Round | TokenType::Floor | TokenType::Ceil | TokenType::Attendre => {
-                let func_name = match token.token_type {
+                let func_name = match token_type {
                     TokenType::Minuscule => "minuscule",
                     TokenType::Majuscule => "majuscule",
                     TokenType::Longueur => "longueur",
@@ -812,7 +735,7 @@ impl Parser {
                 
                 let mut arguments = Vec::new();
                 
-                if token.token_type == TokenType::Aleatoire {
+                if token_type == TokenType::Aleatoire {
                     let start = self.parse_expression()?;
                     self.expect(TokenType::A)?;
                     let end = self.parse_expression()?;
@@ -832,10 +755,36 @@ impl Parser {
                 Err(MeowLangError::new(
                     ErrorCatalog::get("E100"),
                     self.filename.clone(),
-                    token.line,
-                    token.column,
-                ).with_context(&self.source_lines))
+                    position.line,
+                    position.column,
+                ).with_context(&self.source))
             }
         }
     }
 }
+
+const OR_PRECEDENCE: u8 = 1;
+const NOT_PRECEDENCE: u8 = 3;
+const POWER_PRECEDENCE: u8 = 7;
+
+fn binary_operator(token_type: TokenType) -> Option<(&'static str, u8)> {
+    match token_type {
+        TokenType::Ou => Some(("ou", OR_PRECEDENCE)),
+        TokenType::Et => Some(("et", 2)),
+        TokenType::Assign => Some(("=", 4)),
+        TokenType::Equal => Some(("=", 4)),
+        TokenType::NotEqual => Some(("!=", 4)),
+        TokenType::LessThan => Some(("<", 4)),
+        TokenType::GreaterThan => Some((">", 4)),
+        TokenType::LessEqual => Some(("<=", 4)),
+        TokenType::GreaterEqual => Some((">=", 4)),
+        TokenType::Plus => Some(("+", 5)),
+        TokenType::Minus => Some(("-", 5)),
+        TokenType::Multiply => Some(("*", 6)),
+        TokenType::Divide => Some(("/", 6)),
+        TokenType::FloorDiv => Some(("//", 6)),
+        TokenType::Modulo => Some(("%", 6)),
+        TokenType::Power => Some(("**", POWER_PRECEDENCE)),
+        _ => None,
+    }
+}